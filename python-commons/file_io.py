@@ -1,25 +1,47 @@
 from __future__ import annotations
 
+import codecs
+import errno
 import json
 import os
+import secrets
 from pathlib import Path
 import contextlib
-from tempfile import NamedTemporaryFile
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, Mapping
 
 import logging
 
+from .json_encoding import encode_json
+
 logger = logging.get_logger(__name__)
 
-__all__ = ["read_json", "write_json"]
+try:
+    import ijson  # type: ignore
+except ImportError:
+    # ijson is optional; only needed for streaming reads
+    ijson = None  # type: ignore[assignment]
+
+__all__ = ["read_json", "iter_json", "write_json", "write_json_many"]
 
+_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+_PLAIN_FLAGS = _OPEN_FLAGS | os.O_TRUNC
+# Exclusive create so a stale temp file is never reused
+_TMP_FLAGS = _OPEN_FLAGS | os.O_EXCL
 
-def read_json(file_path: str | Path, *, encoding: str = "utf-8") -> Any:
+
+def read_json(
+    file_path: str | Path, *, encoding: str = "utf-8", streaming: bool = False
+) -> Any:
     """Read a JSON file.
 
     Args:
         file_path: Path to the JSON file.
         encoding: Text encoding to use when reading.
+        streaming: If True, return ``iter_json(file_path)`` instead, i.e. an
+            iterator over the elements of a top-level array. ijson only reads
+            UTF-8, so other encodings raise ``ValueError``.
 
     Returns:
         Parsed JSON content.
@@ -29,8 +51,46 @@ def read_json(file_path: str | Path, *, encoding: str = "utf-8") -> Any:
     if not path.exists():
         raise FileNotFoundError(f"JSON file not found: {path}")
 
-    with path.open("r", encoding=encoding) as f:
-        return json.load(f)
+    if streaming:
+        if codecs.lookup(encoding).name != "utf-8":
+            raise ValueError(f"streaming=True only supports UTF-8, not {encoding!r}")
+        return iter_json(path)
+
+    # One C-level decode of the whole file instead of the incremental text
+    # IO layer. Decoding with ``encoding`` (rather than json.loads(bytes),
+    # which sniffs it) keeps BOMs and mismatched encodings an error.
+    # Not orjson: it silently turns integers beyond 64 bits into floats.
+    return json.loads(path.read_bytes().decode(encoding))
+
+
+def iter_json(file_path: str | Path, *, prefix: str = "item") -> Iterator[Any]:
+    """Lazily yield objects from a large JSON file using ``ijson``.
+
+    Memory stays bounded by the size of one yielded object rather than the
+    whole document, so prefer this over ``read_json`` for files that are too
+    big to load at once. ijson picks its fastest backend (yajl2_c) if built.
+
+    Args:
+        file_path: Path to the JSON file.
+        prefix: ijson path of the objects to yield. ``"item"`` means each
+            element of a top-level array; ``"results.item"`` each element of
+            the ``results`` array in a top-level object.
+
+    Returns:
+        Iterator over the parsed objects at ``prefix``.
+
+    """
+    if ijson is None:
+        raise ImportError("iter_json requires 'ijson' (pip install ijson)")
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"JSON file not found: {path}")
+    return _iter_items(path, prefix)
+
+
+def _iter_items(path: Path, prefix: str) -> Iterator[Any]:
+    with path.open("rb") as f:
+        yield from ijson.items(f, prefix, use_float=True)
 
 
 def write_json(
@@ -38,11 +98,14 @@ def write_json(
     data: Any,
     *,
     encoding: str = "utf-8",
-    indent: int | None = 2,
+    indent: int | None = None,
     ensure_ascii: bool = False,
     create_parents: bool = True,
     atomic: bool = True,
     default: Callable[[Any], Any] | None = None,
+    fsync: bool = True,
+    durable: bool = False,
+    use_orjson: bool = False,
 ) -> None:
     """Write data to a JSON file.
 
@@ -53,112 +116,185 @@ def write_json(
         file_path: Destination file path.
         data: JSON-serialisable object to write.
         encoding: Text encoding to use when writing.
-        indent: Indentation level for pretty printing. ``None`` for compact.
+        indent: Indentation level for pretty printing. Defaults to ``None``,
+            which writes minified JSON (no whitespace); pass ``2`` for humans.
         ensure_ascii: If True, escape non-ASCII characters.
-        create_parents: Create parent directories if they do not exist.
+        create_parents: Create parent directories if they do not exist
+            (only attempted when opening the file reports them missing).
         atomic: Use atomic replace to avoid torn writes.
         default: Optional JSON default serialiser callable for unsupported types.
+        fsync: Flush the temporary file to disk before replacing the target.
+            ``atomic=True, fsync=False`` still guarantees readers see either the
+            old or the new file, but not that the new file survives power loss.
+        durable: Also fsync the parent directory after the replace so the
+            rename itself survives a crash. Off by default: it is slow on
+            network filesystems and the directory is otherwise never synced.
+        use_orjson: Encode with ``orjson`` when installed and the options
+            allow it. Much faster, but output differs from stdlib json: NaN and
+            Infinity become ``null``, Enum members their value, and floats use
+            shortest form. See ``encode_json``.
 
     """
     path = Path(file_path)
-    if create_parents:
-        path.parent.mkdir(parents=True, exist_ok=True)
-
 
+    # Build the whole document first so each file costs a single write
+    buf = encode_json(
+        data,
+        encoding=encoding,
+        ensure_ascii=ensure_ascii,
+        indent=indent,
+        default=default,
+        use_orjson=use_orjson,
+    )
     if not atomic:
-        with path.open("w", encoding=encoding, newline="\n") as f:
-            json.dump(
-                data,
-                f,
-                ensure_ascii=ensure_ascii,
-                indent=indent,
-                default=default or _json_default,
-            )
-            f.write("\n")
+        fd = _open(path, _PLAIN_FLAGS, 0o666, create_parents=create_parents)
+        try:
+            _write_all(fd, buf)
+        finally:
+            os.close(fd)
         return
 
     # Atomic write: write to a temporary file then replace
-    with NamedTemporaryFile(
-        mode="w",
-        encoding=encoding,
-        dir=str(path.parent),
-        delete=False,
-        prefix=f".{path.name}.",
-        suffix=".tmp",
-    ) as tmp:
-        tmp_path = Path(tmp.name)
-        try:
-            json.dump(
+    tmp_path = _write_temp(path, buf, fsync=fsync, create_parents=create_parents)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+    if durable:
+        _fsync_dir(path.parent)
+
+
+def write_json_many(
+    items: Mapping[str | Path, Any],
+    *,
+    encoding: str = "utf-8",
+    indent: int | None = None,
+    ensure_ascii: bool = False,
+    create_parents: bool = True,
+    default: Callable[[Any], Any] | None = None,
+    fsync: bool = True,
+    durable: bool = False,
+    use_orjson: bool = False,
+) -> None:
+    """Atomically write several JSON files.
+
+    Every file goes to a temporary file first, then all of them are fsynced,
+    then all are renamed into place. Each file is still fsynced once, but
+    since every write has been issued before the first fsync, the kernel can
+    flush them concurrently instead of one at a time as with repeated
+    ``write_json`` calls. Each file is replaced atomically, but the batch as
+    a whole is not.
+
+    Args:
+        items: Mapping of destination path ➜ JSON-serialisable object.
+        encoding: Text encoding to use when writing.
+        indent: Indentation level for pretty printing. ``None`` for compact.
+        ensure_ascii: If True, escape non-ASCII characters.
+        create_parents: Create parent directories if they do not exist.
+        default: Optional JSON default serialiser callable for unsupported types.
+        fsync: Flush each temporary file to disk before the renames.
+        durable: Also fsync each parent directory (once each) after the renames.
+        use_orjson: Encode with ``orjson``; see ``write_json``.
+
+    """
+    pending: list[tuple[Path, Path]] = []
+    replaced = 0
+    try:
+        for file_path, data in items.items():
+            path = Path(file_path)
+            buf = encode_json(
                 data,
-                tmp,
+                encoding=encoding,
                 ensure_ascii=ensure_ascii,
                 indent=indent,
-                default=default or _json_default,
+                default=default,
+                use_orjson=use_orjson,
             )
-            tmp.write("\n")
-            tmp.flush()
-            os.fsync(tmp.fileno())
-        except Exception:
-            # Best-effort cleanup before re-raising
-            try:
-                tmp.close()
-            finally:
-                with contextlib.suppress(Exception):
-                    tmp_path.unlink(missing_ok=True)
-            raise
+            tmp_path = _write_temp(path, buf, fsync=False, create_parents=create_parents)
+            pending.append((tmp_path, path))
+
+        if fsync:
+            # Second pass: all data is already queued for writeback
+            for tmp_path, _ in pending:
+                _fsync_file(tmp_path)
 
-    os.replace(tmp_path, path)
+        for tmp_path, path in pending:
+            os.replace(tmp_path, path)
+            replaced += 1
+    except BaseException:
+        for tmp_path, _ in pending[replaced:]:
+            _discard(tmp_path)
+        raise
 
+    if durable:
+        for directory in {path.parent for _, path in pending}:
+            _fsync_dir(directory)
 
-def _json_default(value: Any) -> Any:
-    """Fallback JSON serialiser for common non-serialisable types.
 
-    Handles:
-    - pathlib.Path ➜ str
-    - set ➜ sorted list
-    - CRS-like objects ➜ to_string() | to_wkt() | "EPSG:{code}"
-    - numpy scalars (objects with .item()) ➜ native Python scalar
-    - fallback ➜ str(value)
+def _open(path: Path, flags: int, mode: int, *, create_parents: bool) -> int:
+    """``os.open``, creating missing parent directories and retrying once.
+
+    Opening first means the common case (directory exists) costs no mkdir.
     """
-    if isinstance(value, Path):
-        return str(value)
+    try:
+        return os.open(path, flags, mode)
+    except FileNotFoundError:
+        if not create_parents:
+            raise
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return os.open(path, flags, mode)
 
-    if isinstance(value, set):
-        try:
-            return sorted(value)
-        except Exception:
-            return list(value)
 
-    to_string = getattr(value, "to_string", None)
-    if callable(to_string):
+def _write_temp(path: Path, buf: bytes, *, fsync: bool, create_parents: bool) -> Path:
+    """Write ``buf`` to a fresh temporary file next to ``path`` and return its path."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+    fd = _open(tmp_path, _TMP_FLAGS, 0o600, create_parents=create_parents)
+    try:
         try:
-            return to_string()
-        except Exception:
-            pass
+            _write_all(fd, buf)
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+    return tmp_path
 
-    to_wkt = getattr(value, "to_wkt", None)
-    if callable(to_wkt):
-        try:
-            return to_wkt()
-        except Exception:
-            pass
 
-    to_epsg = getattr(value, "to_epsg", None)
-    if callable(to_epsg):
-        try:
-            epsg = to_epsg()
-            if epsg is not None:
-                return f"EPSG:{epsg}"
-        except Exception:
-            pass
-
-    item = getattr(value, "item", None)
-    if callable(item):
-        try:
-            return item()
-        except Exception:
-            pass
+def _fsync_file(path: Path) -> None:
+    fd = os.open(path, _OPEN_FLAGS & ~os.O_CREAT)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _discard(tmp_path: Path) -> None:
+    # Best-effort cleanup before re-raising
+    with contextlib.suppress(OSError):
+        os.unlink(tmp_path)
 
-    return str(value)
 
+def _write_all(fd: int, buf: bytes) -> None:
+    """``os.write`` until ``buf`` is drained (writes may be partial)."""
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(fd, view) :]
 
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist directory entries (e.g. a rename) where the platform allows it."""
+    if not hasattr(os, "O_DIRECTORY"):  # Windows cannot open directories
+        return
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    except OSError as exc:
+        # Some filesystems (e.g. macOS SMB) do not support syncing directories
+        if exc.errno not in (errno.ENOTSUP, errno.EINVAL):
+            raise
+    finally:
+        os.close(dir_fd)
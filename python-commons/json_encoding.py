@@ -0,0 +1,160 @@
+"""JSON encoding shared by the file helpers: stdlib json with an opt-in orjson
+fast path, plus a fallback serialiser for common extra types."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    # orjson is optional; fall back to stdlib json if not installed
+    _orjson = None  # type: ignore[assignment]
+
+__all__ = ["encode_json", "json_default"]
+
+# type ➜ handler used by json_default, filled lazily; None means "probe the
+# instance". A plain dict: types are few and long-lived, and a weak mapping
+# costs more per lookup than the probing it saves.
+_DISPATCH: dict[type, Callable[[Any], Any] | None] = {}
+
+
+def encode_json(
+    data: Any,
+    *,
+    encoding: str,
+    ensure_ascii: bool,
+    indent: int | None,
+    default: Callable[[Any], Any] | None,
+    use_orjson: bool = False,
+) -> bytes:
+    """Serialise ``data`` to encoded bytes, newline-terminated.
+
+    With ``use_orjson`` (and orjson installed, UTF-8, no custom ``default``,
+    ``ensure_ascii=False``, ``indent`` of ``None`` or ``2``) orjson encodes
+    instead of stdlib. Its output differs: NaN/Infinity become ``null``, Enum
+    members become their value, and floats use shortest form (``1e16`` rather
+    than ``1e+16``). Non-string keys and integers beyond 64 bits still go
+    through stdlib.
+    """
+    if use_orjson and _can_use_orjson(encoding, ensure_ascii, indent, default):
+        try:
+            return _orjson_dumps(data, indent=indent) + b"\n"
+        except _orjson.JSONEncodeError:
+            # e.g. non-string keys or integers beyond 64 bits; stdlib handles these
+            pass
+    text = json.dumps(
+        data,
+        ensure_ascii=ensure_ascii,
+        indent=indent,
+        separators=(",", ":") if indent is None else None,
+        default=default or json_default,
+    )
+    return (text + "\n").encode(encoding)
+
+
+def _can_use_orjson(
+    encoding: str, ensure_ascii: bool, indent: int | None, default: Callable[[Any], Any] | None
+) -> bool:
+    return (
+        _orjson is not None
+        and default is None
+        and not ensure_ascii
+        and indent in (None, 2)
+        and _is_utf8(encoding)
+    )
+
+
+def _orjson_dumps(data: Any, *, indent: int | None) -> bytes:
+    """Encode with orjson, deferring non-native types to ``json_default`` like stdlib."""
+    option = _orjson.OPT_PASSTHROUGH_DATETIME | _orjson.OPT_PASSTHROUGH_DATACLASS
+    if indent:
+        option |= _orjson.OPT_INDENT_2
+    return _orjson.dumps(data, option=option, default=json_default)
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+def json_default(value: Any) -> Any:
+    """Fallback JSON serialiser for common non-serialisable types.
+
+    Handles:
+    - pathlib.Path ➜ str
+    - set ➜ sorted list
+    - numpy scalars (objects with .item()) ➜ native Python scalar
+    - CRS-like objects ➜ to_string() | to_wkt() | "EPSG:{code}"
+    - fallback ➜ str(value)
+
+    The handler is resolved once per type and cached in ``_DISPATCH``; other
+    types are probed per instance, since methods may come from ``__getattr__``
+    or instance attributes.
+    """
+    # The two commonest cases are cheaper to test directly than to look up
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, set):
+        try:
+            return sorted(value)
+        except TypeError:  # unorderable mix, e.g. {1, "a"}
+            return list(value)
+
+    try:
+        handler = _DISPATCH[type(value)]
+    except KeyError:
+        handler = _DISPATCH[type(value)] = _resolve_handler(type(value))
+    if handler is not None:
+        return handler(value)
+
+    # numpy scalars were dispatched above, so CRS-like methods come first here.
+    # Third-party methods may reject particular instances, hence the excepts.
+    to_string = getattr(value, "to_string", None)
+    if callable(to_string):
+        try:
+            return to_string()
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+    to_wkt = getattr(value, "to_wkt", None)
+    if callable(to_wkt):
+        try:
+            return to_wkt()
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+    to_epsg = getattr(value, "to_epsg", None)
+    if callable(to_epsg):
+        try:
+            epsg = to_epsg()
+            if epsg is not None:
+                return f"EPSG:{epsg}"
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+    item = getattr(value, "item", None)
+    if callable(item):
+        try:
+            return item()
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+    return str(value)
+
+
+def _resolve_handler(cls: type) -> Callable[[Any], Any] | None:
+    numpy = sys.modules.get("numpy")  # only loaded if the caller already uses numpy
+    if numpy is not None and issubclass(cls, numpy.generic):
+        # Native scalars keep json on its C encoding path
+        if issubclass(cls, numpy.bool_):
+            return bool
+        if issubclass(cls, numpy.integer):
+            return int
+        if issubclass(cls, numpy.floating):
+            return float
+        return numpy.generic.item
+    return None
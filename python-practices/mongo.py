@@ -5,11 +5,20 @@ Unified MongoDB setup for both asynchronous (Motor) and synchronous (PyMongo) ac
 - Reads MongoDB URI from environment or .env (MONGO_URI)
 - Provides shared async and sync clients (global singletons)
 - Safe for reuse across FastAPI app and standalone scripts
+
+Client tuning (environment, read once per URI):
+- MONGO_SERVER_SELECTION_TIMEOUT_MS (default 5000)
+- MONGO_MAX_POOL_SIZE (default 10), MONGO_MIN_POOL_SIZE (default 0)
+- MONGO_MAX_IDLE_MS: close pooled sockets idle this long (default 60000)
+- MONGO_HEARTBEAT_MS: server monitoring interval (default 20000)
+- MONGO_FORCE_TLS: use the certifi CA bundle for non-SRV URIs too
 """
 
 from __future__ import annotations
 
 import os
+import threading
+from functools import lru_cache
 from typing import Optional, AsyncGenerator, Generator, TYPE_CHECKING
 from contextlib import asynccontextmanager, contextmanager
 
@@ -17,6 +26,31 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Optional dependencies are resolved once here rather than on every call
+try:
+    import certifi  # type: ignore
+except ImportError:
+    # certifi is optional; Atlas connections warn without it
+    certifi = None
+
+try:
+    from dotenv import load_dotenv  # type: ignore
+except ImportError:
+    # dotenv is optional; skip if not installed
+    load_dotenv = None
+
+# Private aliases so these runtime fallbacks don't clash with the
+# TYPE_CHECKING imports below
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient as _AsyncIOMotorClient
+except ImportError:
+    _AsyncIOMotorClient = None  # type: ignore[assignment,misc]
+
+try:
+    from pymongo import MongoClient as _MongoClient
+except ImportError:
+    _MongoClient = None  # type: ignore[assignment,misc]
+
 if TYPE_CHECKING:
     from motor.motor_asyncio import AsyncIOMotorClient
     from pymongo import MongoClient
@@ -25,25 +59,48 @@ if TYPE_CHECKING:
 _async_client: Optional["AsyncIOMotorClient"] = None
 _sync_client: Optional["MongoClient"] = None
 
+# Guards singleton creation so concurrent first calls build a single pool
+_lock = threading.Lock()
+
+# Client kwargs per URI (env is read once per URI)
+_kwargs_cache: dict[str, dict] = {}
+
+_SRV_PREFIX = "mongodb+srv://"
+_TRUE_SET = frozenset({"1", "true", "True", "yes", "on"})
+
+
+def _reset_after_fork() -> None:
+    """Drop inherited clients in a forked child; their sockets belong to the parent."""
+    global _async_client, _sync_client, _lock
+    _async_client = None
+    _sync_client = None
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 # ---------------------------------------------------------------------------
 # Utility: get MongoDB URI
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def get_mongo_uri() -> str:
     """
     Read MongoDB URI from environment or .env file.
     Defaults to local instance if not defined.
+    The result is cached; call clear_mongo_config_cache() after changing the env.
     """
-    try:
-        from dotenv import load_dotenv  # type: ignore
-
+    if load_dotenv is not None:
         load_dotenv(override=False)
-    except Exception:
-        # dotenv is optional; skip if not installed
-        pass
-    uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-    return uri
+    return os.getenv("MONGO_URI", "mongodb://localhost:27017")
+
+
+def clear_mongo_config_cache() -> None:
+    """Forget the cached URI and client kwargs so the env is re-read."""
+    get_mongo_uri.cache_clear()
+    _kwargs_cache.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -54,21 +111,31 @@ def _client_kwargs_for_uri(uri: str) -> dict:
     """
     Return kwargs for Mongo clients that are safe for Atlas and on-prem.
     - Adds a reasonable server selection timeout
+    - Bounds the pool, slows heartbeats and sets appname "dev-setup" (singleton tuning)
     - For mongodb+srv (Atlas), attempts to provide CA bundle via certifi when available
+    Cached per URI.
     """
+    kwargs = _kwargs_cache.get(uri)
+    if kwargs is None:
+        kwargs = _kwargs_cache[uri] = _build_client_kwargs(uri)
+    return kwargs
+
+
+def _build_client_kwargs(uri: str) -> dict:
     kwargs: dict = {
         "serverSelectionTimeoutMS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000")),
+        "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "10")),
+        "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+        "maxIdleTimeMS": int(os.getenv("MONGO_MAX_IDLE_MS", "60000")),
+        "heartbeatFrequencyMS": int(os.getenv("MONGO_HEARTBEAT_MS", "20000")),
+        "appname": "dev-setup",
     }
 
-    is_srv = uri.startswith("mongodb+srv://")
-    force_tls = os.getenv("MONGO_FORCE_TLS", "0") in {"1", "true", "True"}
-
-    if is_srv or force_tls:
-        try:
-            import certifi  # type: ignore
-
+    # Atlas (SRV) URIs always use TLS; others only when forced
+    if uri.startswith(_SRV_PREFIX) or os.getenv("MONGO_FORCE_TLS", "0") in _TRUE_SET:
+        if certifi is not None:
             kwargs["tlsCAFile"] = certifi.where()
-        except Exception:  # certifi not installed or not available
+        else:
             logger.warning(
                 "TLS CA bundle not provided (install 'certifi' to avoid SSL issues with Atlas)."
             )
@@ -82,45 +149,63 @@ def _client_kwargs_for_uri(uri: str) -> dict:
 
 def _new_async_client(uri: Optional[str] = None):
     """Create a new AsyncIOMotorClient (never cached)."""
-    from motor.motor_asyncio import AsyncIOMotorClient  # Lazy import
-
+    if _AsyncIOMotorClient is None:
+        raise ImportError("Async MongoDB access requires 'motor' (pip install motor)")
     mongo_uri = uri or get_mongo_uri()
-    kwargs = _client_kwargs_for_uri(mongo_uri)
-    logger.info(f"Connecting (async) to MongoDB at {mongo_uri}")
-    return AsyncIOMotorClient(mongo_uri, **kwargs)
+    logger.info("Connecting (async) to MongoDB at %s", mongo_uri)
+    return _AsyncIOMotorClient(mongo_uri, **_client_kwargs_for_uri(mongo_uri))
 
 
 def get_async_client(uri: Optional[str] = None):
     """Return the global AsyncIOMotorClient instance."""
     global _async_client
     if _async_client is None:
-        _async_client = _new_async_client(uri=uri)
+        with _lock:
+            if _async_client is None:
+                _async_client = _new_async_client(uri=uri)
     return _async_client
 
 
 def close_async_client() -> None:
     """Close the global async client."""
     global _async_client
-    if _async_client:
-        _async_client.close()
-        _async_client = None
+    with _lock:
+        client, _async_client = _async_client, None
+    if client:
+        client.close()
         logger.info("Async MongoDB client closed.")
 
 
 @asynccontextmanager
-async def async_session(client=None) -> AsyncGenerator:
+async def async_session(
+    client=None, *, use_global: bool = True, need_session: bool = True
+) -> AsyncGenerator:
     """
     Async context manager yielding a Motor ClientSession.
+    Without ``client``, uses the global client (``use_global=False`` opens a
+    short-lived one instead). ``need_session=False`` yields None without
+    starting a session, for reads that need no transaction.
     Example:
         async with async_session() as session:
             async with session.start_transaction():
                 ...
+
+        async with async_session(need_session=False) as session:
+            await coll.find_one({...}, session=session)
     """
+    if not need_session:
+        # Driver calls accept session=None, so there is nothing to allocate
+        yield None
+        return
+
     created_client = False
     if client is None:
-        # Use a short-lived client for this session to avoid closing the global one
-        client = _new_async_client()
-        created_client = True
+        if use_global:
+            client = get_async_client()
+        else:
+            # Short-lived client, closed when the session ends
+            client = _new_async_client()
+            created_client = True
 
     session = await client.start_session()
     try:
@@ -137,44 +222,62 @@ async def async_session(client=None) -> AsyncGenerator:
 
 def _new_sync_client(uri: Optional[str] = None):
     """Create a new synchronous MongoClient (never cached)."""
-    from pymongo import MongoClient  # Lazy import
-
+    if _MongoClient is None:
+        raise ImportError("Sync MongoDB access requires 'pymongo' (pip install pymongo)")
     mongo_uri = uri or get_mongo_uri()
-    kwargs = _client_kwargs_for_uri(mongo_uri)
-    logger.info(f"Connecting (sync) to MongoDB at {mongo_uri}")
-    return MongoClient(mongo_uri, **kwargs)
+    logger.info("Connecting (sync) to MongoDB at %s", mongo_uri)
+    return _MongoClient(mongo_uri, **_client_kwargs_for_uri(mongo_uri))
 
 
 def get_sync_client(uri: Optional[str] = None):
     """Return the global synchronous MongoClient instance."""
     global _sync_client
     if _sync_client is None:
-        _sync_client = _new_sync_client(uri=uri)
+        with _lock:
+            if _sync_client is None:
+                _sync_client = _new_sync_client(uri=uri)
     return _sync_client
 
 
 def close_sync_client() -> None:
     """Close the global sync client."""
     global _sync_client
-    if _sync_client:
-        _sync_client.close()
-        _sync_client = None
+    with _lock:
+        client, _sync_client = _sync_client, None
+    if client:
+        client.close()
         logger.info("Sync MongoDB client closed.")
 
 
 @contextmanager
-def sync_session(client=None) -> Generator:
+def sync_session(
+    client=None, *, use_global: bool = True, need_session: bool = True
+) -> Generator:
     """
     Context manager yielding a PyMongo ClientSession.
+    Without ``client``, uses the global client (``use_global=False`` opens a
+    short-lived one instead). ``need_session=False`` yields None without
+    starting a session, for reads that need no transaction.
     Example:
         with sync_session() as session:
             session.with_transaction(lambda s: ...)
+
+        with sync_session(need_session=False) as session:
+            coll.find_one({...}, session=session)
     """
+    if not need_session:
+        # Driver calls accept session=None, so there is nothing to allocate
+        yield None
+        return
+
     created_client = False
     if client is None:
-        # Use a short-lived client for this session to avoid closing the global one
-        client = _new_sync_client()
-        created_client = True
+        if use_global:
+            client = get_sync_client()
+        else:
+            # Short-lived client, closed when the session ends
+            client = _new_sync_client()
+            created_client = True
 
     session = client.start_session()
     try:
@@ -187,6 +290,7 @@ def sync_session(client=None) -> Generator:
 
 __all__ = [
     "get_mongo_uri",
+    "clear_mongo_config_cache",
     "get_async_client",
     "close_async_client",
     "async_session",